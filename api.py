@@ -1,7 +1,147 @@
+import asyncio
+import functools
+import os
+import threading
+import uuid
+from dataclasses import dataclass
 import requests
-from typing import Dict, List, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Mapping, FrozenSet, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 from marshmallow import Schema, fields
 
+_DUMPS: Callable[[Any], bytes]
+_LOADS: Callable[[bytes], Any]
+
+try:
+    import orjson  # type: ignore[import]
+    _DUMPS = orjson.dumps
+    _LOADS = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _DUMPS = _json_dumps
+    _LOADS = json.loads
+
+# Upper bound on pooled connections per host; also caps the async client's
+# worker threads so concurrent calls never open more sockets than the pool keeps.
+_POOL_MAXSIZE = 20
+
+# Maximum number of GET responses each client keeps for ETag revalidation.
+_ETAG_CACHE_SIZE = 128
+
+# Maximum number of requests a single batch call keeps in flight.
+_BATCH_MAX_WORKERS = 8
+
+# Error messages for HTTP statuses the API is documented to return.
+_STATUS_MESSAGES = {
+    400: "Bad request. Please check your input.",
+    401: "Unauthorized. Please check your API key.",
+    404: "Resource not found.",
+}
+
+
+def _type_check(field: fields.Field, var: str) -> Optional[str]:
+    """
+    Returns a Python expression checking that ``var`` matches ``field``'s type,
+    or None if the field type has no inlined check.
+    """
+    if isinstance(field, fields.String):
+        check = f"isinstance({var}, str)"
+    elif isinstance(field, fields.Integer):
+        check = f"(isinstance({var}, int) and not isinstance({var}, bool))"
+    elif isinstance(field, fields.Number):
+        check = f"(isinstance({var}, (int, float)) and not isinstance({var}, bool))"
+    elif isinstance(field, fields.List):
+        inner = _type_check(field.inner, "x")
+        # Same collections marshmallow's List accepts
+        check = f"isinstance({var}, (list, tuple))"
+        if inner is not None:
+            check = f"({check} and all({inner} for x in {var}))"
+    else:
+        return None
+    if field.allow_none:
+        check = f"({var} is None or {check})"
+    return check
+
+
+def _compile_validator(schema: Schema, keys: Optional[Mapping[str, str]] = None) -> Callable[[Mapping[str, Any]], None]:
+    """
+    Generates a straight-line validator for a schema's fields.
+
+    The schema's fields are walked once and the presence and type checks are
+    emitted as plain Python, so validating a payload does not go through
+    marshmallow's per-field machinery.
+
+    Args:
+        schema (Schema): The schema instance to compile.
+        keys (Mapping[str, str], optional): Payload key to check for each field name,
+            for payloads whose keys differ from the schema's. Defaults to the
+            field's data_key or name.
+
+    Returns:
+        callable: A function taking a mapping and raising ValueError if it is invalid.
+    """
+    keys = keys or {}
+    lines = ["def _validate(obj):"]
+    for name, field in schema.fields.items():
+        key = keys.get(name, field.data_key or name)
+        check = _type_check(field, "v")
+        if field.required:
+            lines.append(f"    if {key!r} not in obj: raise ValueError({f'Missing required field: {key}'!r})")
+            indent = "    "
+        else:
+            lines.append(f"    if {key!r} in obj:")
+            indent = "        "
+        if check is not None:
+            lines.append(f"{indent}v = obj[{key!r}]")
+            lines.append(f"{indent}if not {check}: raise ValueError({f'Invalid value for field: {key}'!r})")
+        elif indent != "    ":
+            lines.append(f"{indent}pass")
+    lines.append("    return None")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_validate"]
+
+
+# Compiled validators keyed by schema identity, least recently used first. The
+# schema is stored alongside its validator so its id cannot be reused while cached.
+_VALIDATOR_CACHE_SIZE = 32
+_validator_cache: "OrderedDict[int, Tuple[Schema, Callable[[Mapping[str, Any]], None]]]" = OrderedDict()
+_validator_cache_lock = threading.Lock()
+
+
+def get_validator(schema: Schema) -> Callable[[Mapping[str, Any]], None]:
+    """
+    Returns the compiled validator for a schema instance, compiling it on first use.
+
+    Args:
+        schema (Schema): The schema instance, e.g. one returned by get_schema.
+
+    Returns:
+        callable: A function taking a mapping and raising ValueError if it is invalid.
+    """
+    key = id(schema)
+    with _validator_cache_lock:
+        entry = _validator_cache.get(key)
+        if entry is not None:
+            _validator_cache.move_to_end(key)
+            return entry[1]
+
+    validator = _compile_validator(schema)
+    with _validator_cache_lock:
+        _validator_cache[key] = (schema, validator)
+        if len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+            _validator_cache.popitem(last=False)
+    return validator
+
 class ColorSchema(Schema):
     """
     Marshmallow schema for color information.
@@ -10,6 +150,8 @@ class ColorSchema(Schema):
     hex_code = fields.Str(required=True)
     rgb = fields.List(fields.Int(), required=True)
 
+COLOR_SCHEMA = ColorSchema()
+
 class DesignSchema(Schema):
     """
     Marshmallow schema for design information.
@@ -21,12 +163,23 @@ class DesignSchema(Schema):
     tags = fields.List(fields.Str(), required=True)
     price = fields.Float(required=True)
 
+DESIGN_SCHEMA = DesignSchema()
+
+# Validates the camelCase payload create_design sends against DesignSchema
+_validate_design = _compile_validator(DESIGN_SCHEMA, {
+    "designer_id": "designerId",
+    "design_name": "designName",
+    "design_description": "designDescription",
+})
+
 class ImageSchema(Schema):
     """
     Marshmallow schema for image upload.
     """
     image = fields.Str(required=True)
 
+IMAGE_SCHEMA = ImageSchema()
+
 class AddressSchema(Schema):
     """
     Marshmallow schema for shipping address.
@@ -38,6 +191,232 @@ class AddressSchema(Schema):
     country = fields.Str(required=True)
     zip_code = fields.Str(required=True)
 
+ADDRESS_SCHEMA = AddressSchema()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_schema(schema_cls: Type[Schema], only: Optional[FrozenSet[str]], exclude: FrozenSet[str]) -> Schema:
+    return schema_cls(only=None if only is None else set(only), exclude=set(exclude))
+
+
+def get_schema(schema_cls: Type[Schema], only: Optional[Iterable[str]] = None, exclude: Iterable[str] = ()) -> Schema:
+    """
+    Returns a shared schema instance for the given class and field selection.
+
+    Building a marshmallow schema is far more expensive than using one, so
+    partial schemas (e.g. ``only=...``) are built once and reused.
+
+    Args:
+        schema_cls (type[Schema]): The schema class to instantiate.
+        only (iterable[str], optional): The fields to include.
+        exclude (iterable[str]): The fields to exclude.
+
+    Returns:
+        Schema: The cached schema instance.
+    """
+    return _build_schema(schema_cls, None if only is None else frozenset(only), frozenset(exclude))
+
+
+@dataclass(slots=True)
+class CreateDesignResponse:
+    design_id: str
+    designer_id: str
+    design_name: str
+    design_description: str
+    categories: List[str]
+    tags: List[str]
+    price: float
+    design_url: str
+
+@dataclass(slots=True)
+class UploadImageResponse:
+    image_id: str
+    image_url: str
+
+@dataclass(slots=True)
+class GetDesignDetailsResponse:
+    design_id: str
+    designer_id: str
+    design_name: str
+    design_description: str
+    categories: List[str]
+    tags: List[str]
+    price: float
+    design_url: str
+    image_id: str
+    image_url: str
+    image_upload_timestamp: str
+    image_size: str
+    image_format: str
+
+@dataclass(slots=True)
+class ChooseLogoColorResponse:
+    design_id: str
+    color: Dict[str, Union[str, List[int]]]
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class SelectSizeAndQuantityResponse:
+    design_id: str
+    items: List[Dict[str, Union[str, int]]]
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class SetShippingDestinationResponse:
+    design_id: str
+    address: Dict[str, str]
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class ManagePaymentMethodsResponse:
+    payment_method_id: str
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class PlaceOrderResponse:
+    order_id: str
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class TrackOrderResponse:
+    order_id: str
+    design_url: Optional[str]
+
+@dataclass(slots=True)
+class CancelOrderResponse:
+    order_id: str
+    design_url: Optional[str]
+
+
+# Dataclass attribute -> key in the response's "data" object, per model, and
+# whether the API may omit the key (only for fields typed Optional).
+_FIELD_MAP: Dict[type, Tuple[Tuple[str, str, bool], ...]] = {
+    CreateDesignResponse: (
+        ("design_id", "designId", False),
+        ("designer_id", "designerId", False),
+        ("design_name", "designName", False),
+        ("design_description", "designDescription", False),
+        ("categories", "categories", False),
+        ("tags", "tags", False),
+        ("price", "price", False),
+        ("design_url", "timestamp", False),
+    ),
+    UploadImageResponse: (
+        ("image_id", "imageId", False),
+        ("image_url", "imageUrl", False),
+    ),
+    GetDesignDetailsResponse: (
+        ("design_id", "designId", False),
+        ("designer_id", "designerId", False),
+        ("design_name", "designName", False),
+        ("design_description", "designDescription", False),
+        ("categories", "categories", False),
+        ("tags", "tags", False),
+        ("price", "price", False),
+        ("design_url", "creationTimestamp", False),
+        ("image_id", "imageId", False),
+        ("image_url", "imageUrl", False),
+        ("image_upload_timestamp", "imageUploadTimestamp", False),
+        ("image_size", "imageSize", False),
+        ("image_format", "imageFormat", False),
+    ),
+    ChooseLogoColorResponse: (
+        ("design_id", "designId", False),
+        ("color", "logoColor", False),
+        ("design_url", "designUrl", True),
+    ),
+    SelectSizeAndQuantityResponse: (
+        ("design_id", "designId", False),
+        ("items", "items", False),
+        ("design_url", "designUrl", True),
+    ),
+    SetShippingDestinationResponse: (
+        ("design_id", "designId", False),
+        ("address", "address", False),
+        ("design_url", "designUrl", True),
+    ),
+    ManagePaymentMethodsResponse: (
+        ("payment_method_id", "paymentMethodId", False),
+        ("design_url", "designUrl", True),
+    ),
+    PlaceOrderResponse: (
+        ("order_id", "orderId", False),
+        ("design_url", "designUrl", True),
+    ),
+    TrackOrderResponse: (
+        ("order_id", "orderId", False),
+        ("design_url", "designUrl", True),
+    ),
+    CancelOrderResponse: (
+        ("order_id", "orderId", False),
+        ("design_url", "designUrl", True),
+    ),
+}
+
+ResponseModel = TypeVar("ResponseModel")
+
+
+def _to_model(model: Type[ResponseModel], body: Any) -> ResponseModel:
+    """
+    Builds a response dataclass from a decoded response body.
+
+    Args:
+        model (type): The response dataclass to build.
+        body (dict): The decoded JSON body, with the fields under "data".
+
+    Returns:
+        The response dataclass instance. Optional fields the API did not return are None.
+
+    Raises:
+        ValueError: If the body has no "data" object or lacks a required field.
+    """
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        raise ValueError('Malformed response: missing "data" object.')
+    try:
+        return model(**{attr: data.get(key) if optional else data[key] for attr, key, optional in _FIELD_MAP[model]})
+    except KeyError as e:
+        raise ValueError(f"Malformed response: missing field {e.args[0]!r}.") from None
+
+
+class _MultipartStream:
+    """
+    A multipart/form-data body with a single file part, read from an open
+    binary file in chunks as it is sent rather than buffered in memory.
+    """
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, field_name: str, fileobj: BinaryIO) -> None:
+        boundary = uuid.uuid4().hex
+        name = getattr(fileobj, "name", None)
+        filename = (os.path.basename(name) if isinstance(name, str) else field_name).replace('"', "%22")
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._fileobj = fileobj
+
+        # requests reads the body size from a ``len`` attribute. It is only set
+        # for seekable files; other streams (pipes, sockets) are sent chunked.
+        seekable = getattr(fileobj, "seekable", None)
+        if seekable is not None and seekable():
+            start = fileobj.tell()
+            end = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(start)
+            self.len = len(self._head) + (end - start) + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        read = self._fileobj.read
+        chunk = read(self._CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = read(self._CHUNK_SIZE)
+        yield self._tail
+
 
 class SwagUpApiClient:
     def __init__(self, base_url: str, api_key: str) -> None:
@@ -51,34 +430,116 @@ class SwagUpApiClient:
         self.base_url = base_url
         self.api_key = api_key
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Union[str, int]]:
+        # Endpoint URLs are fixed for the client's lifetime, so build them once.
+        self._url_designs = base_url + "/designs"
+        self._url_design_prefix = base_url + "/designs/"
+        self._url_images = base_url + "/images"
+        self._url_logo_color = base_url + "/logo-color"
+        self._url_orders = base_url + "/orders"
+        self._url_order_prefix = base_url + "/orders/"
+        self._url_sizes_qty = base_url + "/orders/sizes-quantity"
+        self._url_shipping = base_url + "/orders/shipping"
+        self._url_payment = base_url + "/payment-methods"
+
+        # A single pooled session keeps connections alive between calls, so
+        # sequential requests to the same host skip the TCP/TLS handshake.
+        self._session = requests.Session()
+        self._session.headers.update({"X-SwagUp-API-Key": api_key})
+        # Transient failures are retried with backoff at the transport level.
+        # Only idempotent methods are retried so a POST is never sent twice.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Per-request headers for JSON bodies; the API key is already on the session.
+        self._headers_json = MappingProxyType({"Content-Type": "application/json"})
+
+        # Senders bound once to the session, URL and headers of each endpoint.
+        self._post_designs = functools.partial(self._session.post, self._url_designs, headers=self._headers_json)
+        self._post_logo_color = functools.partial(self._session.post, self._url_logo_color, headers=self._headers_json)
+        self._post_sizes_qty = functools.partial(self._session.post, self._url_sizes_qty, headers=self._headers_json)
+        self._post_shipping = functools.partial(self._session.post, self._url_shipping, headers=self._headers_json)
+        self._post_payment = functools.partial(self._session.post, self._url_payment, headers=self._headers_json)
+        self._post_orders = functools.partial(self._session.post, self._url_orders, headers=self._headers_json)
+        self._post_images = functools.partial(self._session.post, self._url_images)
+        self._get = self._session.get
+        self._delete = self._session.delete
+
+        # ETag and raw body of the last successful GET per URL, least recently
+        # used first, used to revalidate with If-None-Match instead of re-downloading.
+        self._etag_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._etag_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP session and releases pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> "SwagUpApiClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _handle_response(self, response: requests.Response, model: Type[ResponseModel]) -> ResponseModel:
         """
         Handles the API response and raises appropriate exceptions for HTTP errors.
 
         Args:
             response (requests.Response): The HTTP response object.
+            model (type): The response dataclass to build from the response data.
 
         Returns:
-            dict: The JSON data from the response.
+            The response dataclass built from the JSON data.
 
         Raises:
-            ValueError: If the response indicates a bad request, unauthorized access, or resource not found.
-        """
-        try:
-            response.raise_for_status()
-            return response.json()
-        except requests.HTTPError as e:
-            # Handle specific HTTP errors
-            if response.status_code == 400:
-                raise ValueError("Bad request. Please check your input.")
-            elif response.status_code == 401:
-                raise ValueError("Unauthorized. Please check your API key.")
-            elif response.status_code == 404:
-                raise ValueError("Resource not found.")
-            else:
-                raise ValueError(f"Request failed with status code: {response.status_code}")
-
-    def create_design(self, designer_id: str, design_name: str, design_description: str, categories: List[str], tags: List[str], price: float) -> Dict[str, Union[str, int]]:
+            ValueError: If the response indicates a bad request, unauthorized access, or resource not found,
+                or a successful response is missing required data.
+        """
+        status_code = response.status_code
+        if 200 <= status_code < 300:
+            return _to_model(model, _LOADS(response.content))
+        raise ValueError(_STATUS_MESSAGES.get(status_code) or f"Request failed with status code: {status_code}")
+
+    def _conditional_get(self, url: str, model: Type[ResponseModel]) -> ResponseModel:
+        """
+        Sends a GET request, revalidating any cached copy with its ETag.
+
+        Args:
+            url (str): The URL to fetch.
+            model (type): The response dataclass to build from the response data.
+
+        Returns:
+            The response dataclass, built from the response or from the cache on a 304.
+        """
+        with self._etag_cache_lock:
+            cached = self._etag_cache.get(url)
+            if cached is not None:
+                self._etag_cache.move_to_end(url)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+
+        response = self._get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return _to_model(model, _LOADS(cached[1]))
+
+        data = self._handle_response(response, model)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_cache_lock:
+                self._etag_cache[url] = (etag, response.content)
+                self._etag_cache.move_to_end(url)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    def create_design(self, designer_id: str, design_name: str, design_description: str, categories: List[str], tags: List[str], price: float) -> CreateDesignResponse:
         """
         Creates a new design.
 
@@ -93,10 +554,11 @@ class SwagUpApiClient:
             price (float): The price of the design.
 
         Returns:
-            dict: The response JSON containing the details of the created design.
+            CreateDesignResponse: The details of the created design.
+
+        Raises:
+            ValueError: If the design fields are missing or of the wrong type.
         """
-        url = f"{self.base_url}/designs"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {
             "designerId": designer_id,
             "designName": design_name,
@@ -105,30 +567,46 @@ class SwagUpApiClient:
             "tags": tags,
             "price": price
         }
+        _validate_design(payload)
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_designs(data=_DUMPS(payload))
+        return self._handle_response(response, CreateDesignResponse)
 
-    def upload_image(self, image: str) -> Dict[str, Union[str, int]]:
+    def upload_image(self, image: Union[str, BinaryIO]) -> UploadImageResponse:
         """
         Uploads an image for customization.
 
         Endpoint: POST /images
 
         Args:
-            image (file): The image file to upload.
+            image (str | file): The path of the image file, or an open binary
+                file. The file is streamed from its current position without
+                being read into memory.
 
         Returns:
-            dict: The response JSON containing the details of the uploaded image.
+            UploadImageResponse: The details of the uploaded image.
         """
-        url = f"{self.base_url}/images"
-        headers = {"X-SwagUp-API-Key": self.api_key}
-        files = {"image": image}
+        if isinstance(image, str):
+            with open(image, "rb") as fileobj:
+                response = self._post_image_stream(fileobj)
+        else:
+            response = self._post_image_stream(image)
+        return self._handle_response(response, UploadImageResponse)
+
+    def _post_image_stream(self, fileobj: BinaryIO) -> requests.Response:
+        """
+        Posts an open binary file to the images endpoint as a streamed multipart body.
+
+        Args:
+            fileobj (file): The open binary file to upload.
 
-        response = requests.post(url, headers=headers, files=files)
-        return self._handle_response(response)
+        Returns:
+            requests.Response: The HTTP response object.
+        """
+        body = _MultipartStream("image", fileobj)
+        return self._post_images(data=body, headers={"Content-Type": body.content_type})
 
-    def get_design_details(self, design_id: str) -> Dict[str, Union[str, int]]:
+    def get_design_details(self, design_id: str) -> GetDesignDetailsResponse:
         """
         Retrieves the details of a design.
 
@@ -138,15 +616,13 @@ class SwagUpApiClient:
             design_id (str): The ID of the design to fetch details for.
 
         Returns:
-            dict: The response JSON containing the details of the design.
+            GetDesignDetailsResponse: The details of the design.
         """
-        url = f"{self.base_url}/designs/{design_id}"
-        headers = {"X-SwagUp-API-Key": self.api_key}
+        url = f"{self._url_design_prefix}{design_id}"
 
-        response = requests.get(url, headers=headers)
-        return self._handle_response(response)
+        return self._conditional_get(url, GetDesignDetailsResponse)
 
-    def choose_logo_color(self, color: Dict[str, Union[str, List[int]]], design_id: str) -> Dict[str, Union[str, int]]:
+    def choose_logo_color(self, color: Dict[str, Union[str, List[int]]], design_id: str) -> ChooseLogoColorResponse:
         """
         Selects the color for the logo.
 
@@ -157,19 +633,17 @@ class SwagUpApiClient:
             design_id (str): The ID of the design to set the logo color for.
 
         Returns:
-            dict: The response JSON containing the updated design details.
+            ChooseLogoColorResponse: The updated design details.
         """
-        url = f"{self.base_url}/logo-color"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {
             "color": color,
             "designId": design_id
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_logo_color(data=_DUMPS(payload))
+        return self._handle_response(response, ChooseLogoColorResponse)
 
-    def select_size_and_quantity(self, design_id: str, items: List[Dict[str, Union[str, int]]]) -> Dict[str, Union[str, int]]:
+    def select_size_and_quantity(self, design_id: str, items: List[Dict[str, Union[str, int]]]) -> SelectSizeAndQuantityResponse:
         """
         Selects the sizes and quantities for an order.
 
@@ -180,19 +654,37 @@ class SwagUpApiClient:
             items (list[dict]): The list of items with size and quantity information.
 
         Returns:
-            dict: The response JSON containing the updated design details.
+            SelectSizeAndQuantityResponse: The updated design details.
         """
-        url = f"{self.base_url}/orders/sizes-quantity"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {
             "designId": design_id,
             "items": items
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_sizes_qty(data=_DUMPS(payload))
+        return self._handle_response(response, SelectSizeAndQuantityResponse)
+
+    def batch_set_sizes(self, jobs: List[Tuple[str, List[Dict[str, Union[str, int]]]]]) -> List[SelectSizeAndQuantityResponse]:
+        """
+        Selects sizes and quantities for several designs at once.
+
+        Requests are issued concurrently over the client's pooled session
+        rather than one after another.
+
+        Endpoint: POST /orders/sizes-quantity (once per job)
+
+        Args:
+            jobs (list[tuple[str, list[dict]]]): Pairs of design ID and the items for that design.
+
+        Returns:
+            list[SelectSizeAndQuantityResponse]: The result of each job, in the order the jobs were given.
+        """
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.select_size_and_quantity(*job), jobs))
 
-    def set_shipping_destination(self, design_id: str, address: Dict[str, str]) -> Dict[str, Union[str, int]]:
+    def set_shipping_destination(self, design_id: str, address: Dict[str, str]) -> SetShippingDestinationResponse:
         """
         Sets the shipping destination for an order.
 
@@ -203,19 +695,17 @@ class SwagUpApiClient:
             address (dict): The address information including recipient name, street, city, state, country, and ZIP.
 
         Returns:
-            dict: The response JSON containing the updated design details.
+            SetShippingDestinationResponse: The updated design details.
         """
-        url = f"{self.base_url}/orders/shipping"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {
             "designId": design_id,
             "address": address
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_shipping(data=_DUMPS(payload))
+        return self._handle_response(response, SetShippingDestinationResponse)
 
-    def manage_payment_methods(self, payment_method: Dict[str, str]) -> Dict[str, Union[str, int]]:
+    def manage_payment_methods(self, payment_method: Dict[str, str]) -> ManagePaymentMethodsResponse:
         """
         Adds a payment method.
 
@@ -225,16 +715,14 @@ class SwagUpApiClient:
             payment_method (dict): The payment method details.
 
         Returns:
-            dict: The response JSON containing the details of the added payment method.
+            ManagePaymentMethodsResponse: The details of the added payment method.
         """
-        url = f"{self.base_url}/payment-methods"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {"paymentMethod": payment_method}
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_payment(data=_DUMPS(payload))
+        return self._handle_response(response, ManagePaymentMethodsResponse)
 
-    def place_order(self, design_id: str, payment_method_id: str) -> Dict[str, Union[str, int]]:
+    def place_order(self, design_id: str, payment_method_id: str) -> PlaceOrderResponse:
         """
         Places an order.
 
@@ -245,19 +733,17 @@ class SwagUpApiClient:
             payment_method_id (str): The ID of the payment method to use for the order.
 
         Returns:
-            dict: The response JSON containing the details of the placed order.
+            PlaceOrderResponse: The details of the placed order.
         """
-        url = f"{self.base_url}/orders"
-        headers = {"X-SwagUp-API-Key": self.api_key}
         payload = {
             "designId": design_id,
             "paymentMethodId": payment_method_id
         }
 
-        response = requests.post(url, headers=headers, json=payload)
-        return self._handle_response(response)
+        response = self._post_orders(data=_DUMPS(payload))
+        return self._handle_response(response, PlaceOrderResponse)
 
-    def track_order(self, order_id: str) -> Dict[str, Union[str, int]]:
+    def track_order(self, order_id: str) -> TrackOrderResponse:
         """
         Tracks an order.
 
@@ -267,15 +753,13 @@ class SwagUpApiClient:
             order_id (str): The ID of the order to track.
 
         Returns:
-            dict: The response JSON containing the details of the tracked order.
+            TrackOrderResponse: The details of the tracked order.
         """
-        url = f"{self.base_url}/orders/{order_id}"
-        headers = {"X-SwagUp-API-Key": self.api_key}
+        url = f"{self._url_order_prefix}{order_id}"
 
-        response = requests.get(url, headers=headers)
-        return self._handle_response(response)
+        return self._conditional_get(url, TrackOrderResponse)
 
-    def cancel_order(self, order_id: str) -> Dict[str, Union[str, int]]:
+    def cancel_order(self, order_id: str) -> CancelOrderResponse:
         """
         Cancels an order.
 
@@ -285,10 +769,116 @@ class SwagUpApiClient:
             order_id (str): The ID of the order to cancel.
 
         Returns:
-            dict: The response JSON containing the details of the cancelled order.
+            CancelOrderResponse: The details of the cancelled order.
+        """
+        url = f"{self._url_order_prefix}{order_id}"
+
+        response = self._delete(url)
+        return self._handle_response(response, CancelOrderResponse)
+
+
+class SwagUpAsyncApiClient:
+    def __init__(self, base_url: str, api_key: str, max_workers: int = _POOL_MAXSIZE) -> None:
+        """
+        Initializes the SwagUpAsyncApiClient with the base URL and API key.
+
+        Calls are dispatched to a SwagUpApiClient on a bounded thread pool, so
+        independent requests can be awaited together with asyncio.gather while
+        sharing one pooled session.
+
+        Args:
+            base_url (str): The base URL of the SwagUp API.
+            api_key (str): The API key for authentication.
+            max_workers (int): The maximum number of requests in flight at once.
+                Values above the connection pool size (20) are capped to it.
+        """
+        self._client = SwagUpApiClient(base_url, api_key)
+        self._executor = ThreadPoolExecutor(max_workers=min(max_workers, _POOL_MAXSIZE))
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a blocking client call on the worker pool and awaits its result.
+
+        Args:
+            func (callable): The SwagUpApiClient method to call.
+            *args: The positional arguments to pass to it.
+
+        Returns:
+            The value returned by the call.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def aclose(self) -> None:
+        """
+        Waits for in-flight requests, then closes the underlying client.
         """
-        url = f"{self.base_url}/orders/{order_id}"
-        headers = {"X-SwagUp-API-Key": self.api_key}
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        self._client.close()
 
-        response = requests.delete(url, headers=headers)
-        return self._handle_response(response)
+    async def __aenter__(self) -> "SwagUpAsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def create_design(self, designer_id: str, design_name: str, design_description: str, categories: List[str], tags: List[str], price: float) -> CreateDesignResponse:
+        """
+        Creates a new design. See SwagUpApiClient.create_design.
+        """
+        return await self._run(self._client.create_design, designer_id, design_name, design_description, categories, tags, price)
+
+    async def upload_image(self, image: Union[str, BinaryIO]) -> UploadImageResponse:
+        """
+        Uploads an image for customization. See SwagUpApiClient.upload_image.
+        """
+        return await self._run(self._client.upload_image, image)
+
+    async def get_design_details(self, design_id: str) -> GetDesignDetailsResponse:
+        """
+        Retrieves the details of a design. See SwagUpApiClient.get_design_details.
+        """
+        return await self._run(self._client.get_design_details, design_id)
+
+    async def choose_logo_color(self, color: Dict[str, Union[str, List[int]]], design_id: str) -> ChooseLogoColorResponse:
+        """
+        Selects the color for the logo. See SwagUpApiClient.choose_logo_color.
+        """
+        return await self._run(self._client.choose_logo_color, color, design_id)
+
+    async def select_size_and_quantity(self, design_id: str, items: List[Dict[str, Union[str, int]]]) -> SelectSizeAndQuantityResponse:
+        """
+        Selects the sizes and quantities for an order. See SwagUpApiClient.select_size_and_quantity.
+        """
+        return await self._run(self._client.select_size_and_quantity, design_id, items)
+
+    async def set_shipping_destination(self, design_id: str, address: Dict[str, str]) -> SetShippingDestinationResponse:
+        """
+        Sets the shipping destination for an order. See SwagUpApiClient.set_shipping_destination.
+        """
+        return await self._run(self._client.set_shipping_destination, design_id, address)
+
+    async def manage_payment_methods(self, payment_method: Dict[str, str]) -> ManagePaymentMethodsResponse:
+        """
+        Adds a payment method. See SwagUpApiClient.manage_payment_methods.
+        """
+        return await self._run(self._client.manage_payment_methods, payment_method)
+
+    async def place_order(self, design_id: str, payment_method_id: str) -> PlaceOrderResponse:
+        """
+        Places an order. See SwagUpApiClient.place_order.
+        """
+        return await self._run(self._client.place_order, design_id, payment_method_id)
+
+    async def track_order(self, order_id: str) -> TrackOrderResponse:
+        """
+        Tracks an order. See SwagUpApiClient.track_order.
+        """
+        return await self._run(self._client.track_order, order_id)
+
+    async def cancel_order(self, order_id: str) -> CancelOrderResponse:
+        """
+        Cancels an order. See SwagUpApiClient.cancel_order.
+        """
+        return await self._run(self._client.cancel_order, order_id)
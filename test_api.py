@@ -1,446 +1,658 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
 import unittest
+from collections import OrderedDict
+from unittest import mock
 import responses
-from dataclasses import dataclass
-from typing import List, Dict, Union
-from api import SwagUpApiClient
-
-@dataclass
-class CreateDesignResponse:
-    design_id: str
-    designer_id: str
-    design_name: str
-    design_description: str
-    categories: List[str]
-    tags: List[str]
-    price: float
-    design_url: str
-
-@dataclass
-class UploadImageResponse:
-    image_id: str
-    image_url: str
-
-@dataclass
-class GetDesignDetailsResponse:
-    design_id: str
-    designer_id: str
-    design_name: str
-    design_description: str
-    categories: List[str]
-    tags: List[str]
-    price: float
-    design_url: str
-    image_id: str
-    image_url: str
-    image_upload_timestamp: str
-    image_size: str
-    image_format: str
-
-@dataclass
-class ChooseLogoColorResponse:
-    design_id: str
-    color: Dict[str, Union[str, List[int]]]
-    design_url: str
-
-@dataclass
-class SelectSizeAndQuantityResponse:
-    design_id: str
-    items: List[Dict[str, Union[str, int]]]
-    design_url: str
-
-@dataclass
-class SetShippingDestinationResponse:
-    design_id: str
-    address: Dict[str, str]
-    design_url: str
-
-@dataclass
-class ManagePaymentMethodsResponse:
-    payment_method_id: str
-    design_url: str
-
-@dataclass
-class PlaceOrderResponse:
-    order_id: str
-    design_url: str
-
-@dataclass
-class TrackOrderResponse:
-    order_id: str
-    design_url: str
-
-@dataclass
-class CancelOrderResponse:
-    order_id: str
-    design_url: str
+import api
+from api import (
+    SwagUpApiClient,
+    SwagUpAsyncApiClient,
+    CreateDesignResponse,
+    UploadImageResponse,
+    GetDesignDetailsResponse,
+    ChooseLogoColorResponse,
+    SelectSizeAndQuantityResponse,
+    SetShippingDestinationResponse,
+    ManagePaymentMethodsResponse,
+    PlaceOrderResponse,
+    TrackOrderResponse,
+    CancelOrderResponse,
+    ColorSchema,
+    DesignSchema,
+    DESIGN_SCHEMA,
+    get_schema,
+    get_validator,
+)
+
+_BASE_URL = "https://api.example.com"
+
+# Request bodies the client is expected to send and the canned API responses,
+# built once and shared by every test (none of them mutate these).
+_CREATE_DESIGN_PAYLOAD = {
+    "designerId": "designer123",
+    "designName": "Cool Cat",
+    "designDescription": "Cat wearing sunglasses",
+    "categories": ["Animals", "Humor"],
+    "tags": ["cat", "cool", "sunglasses"],
+    "price": 19.99
+}
+_CREATE_DESIGN_RESPONSE = {
+    "status": "success",
+    "message": "Design created successfully",
+    "data": {
+        "designId": "123",
+        "designerId": "designer123",
+        "designName": "Cool Cat",
+        "designDescription": "Cat wearing sunglasses",
+        "categories": ["Animals", "Humor"],
+        "tags": ["cat", "cool", "sunglasses"],
+        "price": 19.99,
+        "timestamp": "2023-07-10T15:00:00Z"
+    }
+}
+
+_UPLOAD_IMAGE_RESPONSE = {
+    "status": "success",
+    "message": "Image uploaded successfully",
+    "data": {
+        "imageId": "456",
+        "imageUrl": "https://your-api.com/images/456",
+        "uploadTimestamp": "2023-07-10T15:05:00Z",
+        "imageSize": "1.5MB",
+        "imageFormat": "png"
+    }
+}
+
+_GET_DESIGN_DETAILS_RESPONSE = {
+    "status": "success",
+    "message": "Design details fetched successfully",
+    "data": {
+        "designId": "123",
+        "designerId": "designer123",
+        "designName": "Cool Cat",
+        "designDescription": "Cat wearing sunglasses",
+        "categories": ["Animals", "Humor"],
+        "tags": ["cat", "cool", "sunglasses"],
+        "price": 19.99,
+        "creationTimestamp": "2023-07-10T15:00:00Z",
+        "imageId": "456",
+        "imageUrl": "https://your-api.com/images/456",
+        "imageUploadTimestamp": "2023-07-10T15:05:00Z",
+        "imageSize": "1.5MB",
+        "imageFormat": "png"
+    }
+}
+
+_CHOOSE_LOGO_COLOR_PAYLOAD = {
+    "color": {
+        "name": "Red",
+        "hex": "#FF0000",
+        "rgb": [255, 0, 0]
+    },
+    "designId": "123"
+}
+_CHOOSE_LOGO_COLOR_RESPONSE = {
+    "status": "success",
+    "message": "Logo color set successfully",
+    "data": {
+        "designId": "123",
+        "logoColor": {
+            "name": "Red",
+            "hex": "#FF0000",
+            "rgb": [255, 0, 0]
+        }
+    }
+}
+
+_SELECT_SIZE_AND_QUANTITY_PAYLOAD = {
+    "designId": "123",
+    "items": [
+        {"size": "S", "quantity": 50},
+        {"size": "M", "quantity": 100},
+        {"size": "L", "quantity": 50}
+    ]
+}
+_SELECT_SIZE_AND_QUANTITY_RESPONSE = {
+    "status": "success",
+    "message": "Sizes and quantities set successfully",
+    "data": {
+        "designId": "123",
+        "items": [
+            {"size": "S", "quantity": 50},
+            {"size": "M", "quantity": 100},
+            {"size": "L", "quantity": 50}
+        ]
+    }
+}
+
+_SET_SHIPPING_DESTINATION_PAYLOAD = {
+    "designId": "123",
+    "address": {
+        "recipientName": "John Doe",
+        "street": "123 Swag Street",
+        "city": "Swag City",
+        "state": "Swag State",
+        "country": "Swag Country",
+        "zip": "12345"
+    }
+}
+_SET_SHIPPING_DESTINATION_RESPONSE = {
+    "status": "success",
+    "message": "Shipping address set successfully",
+    "data": {
+        "designId": "123",
+        "address": {
+            "recipientName": "John Doe",
+            "street": "123 Swag Street",
+            "city": "Swag City",
+            "state": "Swag State",
+            "country": "Swag Country",
+            "zip": "12345"
+        }
+    }
+}
+
+_MANAGE_PAYMENT_METHODS_PAYLOAD = {
+    "paymentMethod": {
+        "type": "credit card",
+        "cardNumber": "1234567812345678",
+        "expiryDate": "07/25",
+        "cvv": "123"
+    }
+}
+_MANAGE_PAYMENT_METHODS_RESPONSE = {
+    "status": "success",
+    "message": "Payment method added successfully",
+    "data": {
+        "paymentMethodId": "payment123",
+        "type": "credit card",
+        "expiryDate": "07/25"
+    }
+}
+
+_PLACE_ORDER_PAYLOAD = {
+    "designId": "123",
+    "paymentMethodId": "payment123"
+}
+_PLACE_ORDER_RESPONSE = {
+    "status": "success",
+    "message": "Order placed successfully",
+    "data": {
+        "orderId": "order123",
+        "designId": "123",
+        "paymentMethodId": "payment123",
+        "status": "Processing",
+        "timestamp": "2023-07-10T16:00:00Z"
+    }
+}
+
+_TRACK_ORDER_RESPONSE = {
+    "status": "success",
+    "message": "Order fetched successfully",
+    "data": {
+        "orderId": "order123",
+        "designId": "123",
+        "status": "Shipped",
+        "timestamp": "2023-07-10T16:00:00Z",
+        "shippingAddress": {
+            "recipientName": "John Doe",
+            "street": "123 Swag Street",
+            "city": "Swag City",
+            "state": "Swag State",
+            "country": "Swag Country",
+            "zip": "12345"
+        },
+        "estimatedDelivery": "2023-07-17T16:00:00Z"
+    }
+}
+
+_CANCEL_ORDER_RESPONSE = {
+    "status": "success",
+    "message": "Order cancelled successfully",
+    "data": {
+        "orderId": "order123",
+        "status": "Cancelled"
+    }
+}
+
+_ROUTES = (
+    (responses.POST, f"{_BASE_URL}/designs", _CREATE_DESIGN_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/images", _UPLOAD_IMAGE_RESPONSE),
+    (responses.GET, f"{_BASE_URL}/designs/123", _GET_DESIGN_DETAILS_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/logo-color", _CHOOSE_LOGO_COLOR_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/orders/sizes-quantity", _SELECT_SIZE_AND_QUANTITY_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/orders/shipping", _SET_SHIPPING_DESTINATION_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/payment-methods", _MANAGE_PAYMENT_METHODS_RESPONSE),
+    (responses.POST, f"{_BASE_URL}/orders", _PLACE_ORDER_RESPONSE),
+    (responses.GET, f"{_BASE_URL}/orders/order123", _TRACK_ORDER_RESPONSE),
+    (responses.DELETE, f"{_BASE_URL}/orders/order123", _CANCEL_ORDER_RESPONSE),
+)
 
 class SwagUpApiClientTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Register the canned endpoints once for the whole class
+        cls.mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+        for method, url, body in _ROUTES:
+            cls.mock.add(method, url, json=body, status=200)
+        cls.mock.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock.stop()
+        cls.mock.reset()
+
     def setUp(self):
         # Create an instance of SwagUpApiClient
-        self.client = SwagUpApiClient(base_url="https://api.example.com", api_key="your_api_key")
+        self.client = SwagUpApiClient(base_url=_BASE_URL, api_key="your_api_key")
+        self.mock.calls.reset()
 
-    @responses.activate
     def test_create_design(self):
-        expected_payload = {
-            "designerId": "designer123",
-            "designName": "Cool Cat",
-            "designDescription": "Cat wearing sunglasses",
-            "categories": ["Animals", "Humor"],
-            "tags": ["cat", "cool", "sunglasses"],
-            "price": 19.99
-        }
-        response_data = {
-            "status": "success",
-            "message": "Design created successfully",
-            "data": {
-                "designId": "123",
-                "designerId": "designer123",
-                "designName": "Cool Cat",
-                "designDescription": "Cat wearing sunglasses",
-                "categories": ["Animals", "Humor"],
-                "tags": ["cat", "cool", "sunglasses"],
-                "price": 19.99,
-                "timestamp": "2023-07-10T15:00:00Z"
-            }
-        }
-
-        responses.add(responses.POST, "https://api.example.com/designs", json=response_data, status=200)
-
         response = self.client.create_design(
-            designer_id=expected_payload["designerId"],
-            design_name=expected_payload["designName"],
-            design_description=expected_payload["designDescription"],
-            categories=expected_payload["categories"],
-            tags=expected_payload["tags"],
-            price=expected_payload["price"]
+            designer_id=_CREATE_DESIGN_PAYLOAD["designerId"],
+            design_name=_CREATE_DESIGN_PAYLOAD["designName"],
+            design_description=_CREATE_DESIGN_PAYLOAD["designDescription"],
+            categories=_CREATE_DESIGN_PAYLOAD["categories"],
+            tags=_CREATE_DESIGN_PAYLOAD["tags"],
+            price=_CREATE_DESIGN_PAYLOAD["price"]
         )
 
+        data = _CREATE_DESIGN_RESPONSE["data"]
         self.assertIsInstance(response, CreateDesignResponse)
-        self.assertEqual(response.design_id, response_data["data"]["designId"])
-        self.assertEqual(response.designer_id, response_data["data"]["designerId"])
-        self.assertEqual(response.design_name, response_data["data"]["designName"])
-        self.assertEqual(response.design_description, response_data["data"]["designDescription"])
-        self.assertEqual(response.categories, response_data["data"]["categories"])
-        self.assertEqual(response.tags, response_data["data"]["tags"])
-        self.assertEqual(response.price, response_data["data"]["price"])
-        self.assertEqual(response.design_url, response_data["data"]["timestamp"])
+        self.assertEqual(response.design_id, data["designId"])
+        self.assertEqual(response.designer_id, data["designerId"])
+        self.assertEqual(response.design_name, data["designName"])
+        self.assertEqual(response.design_description, data["designDescription"])
+        self.assertEqual(response.categories, data["categories"])
+        self.assertEqual(response.tags, data["tags"])
+        self.assertEqual(response.price, data["price"])
+        self.assertEqual(response.design_url, data["timestamp"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/designs")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _CREATE_DESIGN_PAYLOAD)
+
+    def test_create_design_rejects_invalid_fields(self):
+        with self.assertRaises(ValueError):
+            self.client.create_design(
+                designer_id="designer123",
+                design_name="Cool Cat",
+                design_description="Cat wearing sunglasses",
+                categories=["Animals", 42],
+                tags=["cat"],
+                price=19.99
+            )
+
+        self.assertEqual(len(self.mock.calls), 0)
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/designs")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
-
-    @responses.activate
     def test_upload_image(self):
-        expected_image_file = "/path/to/image.png"
-        response_data = {
-            "status": "success",
-            "message": "Image uploaded successfully",
-            "data": {
-                "imageId": "456",
-                "imageUrl": "https://your-api.com/images/456",
-                "uploadTimestamp": "2023-07-10T15:05:00Z",
-                "imageSize": "1.5MB",
-                "imageFormat": "png"
-            }
-        }
+        url = "https://api.example.com/images"
+        bodies = []
 
-        responses.add(responses.POST, "https://api.example.com/images", json=response_data, status=200)
+        # Read the streamed body inside the callback, while the file is still open
+        def callback(request):
+            bodies.append(b"".join(request.body))
+            return 200, {}, json.dumps(_UPLOAD_IMAGE_RESPONSE)
 
-        response = self.client.upload_image(image=expected_image_file)
+        self.mock.remove(responses.POST, url)
+        self.mock.add_callback(responses.POST, url, callback=callback)
+        self.addCleanup(self.mock.add, responses.POST, url, json=_UPLOAD_IMAGE_RESPONSE, status=200)
+        self.addCleanup(self.mock.remove, responses.POST, url)
 
-        self.assertIsInstance(response, UploadImageResponse)
-        self.assertEqual(response.image_id, response_data["data"]["imageId"])
-        self.assertEqual(response.image_url, response_data["data"]["imageUrl"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "image.png")
+            with open(path, "wb") as f:
+                f.write(b"\x89PNG image bytes")
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/images")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertIn("multipart/form-data", responses.calls[0].request.headers["Content-Type"])
+            response = self.client.upload_image(image=path)
+
+        data = _UPLOAD_IMAGE_RESPONSE["data"]
+        self.assertIsInstance(response, UploadImageResponse)
+        self.assertEqual(response.image_id, data["imageId"])
+        self.assertEqual(response.image_url, data["imageUrl"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, url)
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertIn("multipart/form-data", self.mock.calls[0].request.headers["Content-Type"])
+        self.assertEqual(int(self.mock.calls[0].request.headers["Content-Length"]), len(bodies[0]))
+        self.assertIn(b'name="image"; filename="image.png"', bodies[0])
+        self.assertIn(b"\x89PNG image bytes", bodies[0])
+        self.assertNotIn(path.encode(), bodies[0])
+
+    def test_upload_image_streams_file_object(self):
+        image_bytes = b"\x89PNG" + b"\x00" * 200000
+
+        self.client.upload_image(image=io.BytesIO(image_bytes))
+
+        request = self.mock.calls[0].request
+        body = b"".join(request.body)
+        self.assertIn("multipart/form-data; boundary=", request.headers["Content-Type"])
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        self.assertIn(b'name="image"', body)
+        self.assertIn(image_bytes, body)
+
+    def test_upload_image_streams_unseekable_descriptor(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"\x89PNG piped bytes")
+        os.close(write_fd)
+
+        with open(read_fd, "rb") as pipe:
+            self.client.upload_image(image=pipe)
+
+            request = self.mock.calls[0].request
+            body = b"".join(request.body)
+
+        self.assertEqual(request.headers["Transfer-Encoding"], "chunked")
+        self.assertNotIn("Content-Length", request.headers)
+        self.assertIn(b'name="image"; filename="image"', body)
+        self.assertIn(b"\x89PNG piped bytes", body)
 
-    @responses.activate
     def test_get_design_details(self):
-        design_id = "123"
-        response_data = {
-            "status": "success",
-            "message": "Design details fetched successfully",
-            "data": {
-                "designId": "123",
-                "designerId": "designer123",
-                "designName": "Cool Cat",
-                "designDescription": "Cat wearing sunglasses",
-                "categories": ["Animals", "Humor"],
-                "tags": ["cat", "cool", "sunglasses"],
-                "price": 19.99,
-                "creationTimestamp": "2023-07-10T15:00:00Z",
-                "imageId": "456",
-                "imageUrl": "https://your-api.com/images/456",
-                "imageUploadTimestamp": "2023-07-10T15:05:00Z",
-                "imageSize": "1.5MB",
-                "imageFormat": "png"
-            }
-        }
+        response = self.client.get_design_details("123")
+
+        data = _GET_DESIGN_DETAILS_RESPONSE["data"]
+        self.assertIsInstance(response, GetDesignDetailsResponse)
+        self.assertEqual(response.design_id, data["designId"])
+        self.assertEqual(response.designer_id, data["designerId"])
+        self.assertEqual(response.design_name, data["designName"])
+        self.assertEqual(response.design_description, data["designDescription"])
+        self.assertEqual(response.categories, data["categories"])
+        self.assertEqual(response.tags, data["tags"])
+        self.assertEqual(response.price, data["price"])
+        self.assertEqual(response.design_url, data["creationTimestamp"])
+        self.assertEqual(response.image_id, data["imageId"])
+        self.assertEqual(response.image_url, data["imageUrl"])
+        self.assertEqual(response.image_upload_timestamp, data["imageUploadTimestamp"])
+        self.assertEqual(response.image_size, data["imageSize"])
+        self.assertEqual(response.image_format, data["imageFormat"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/designs/123")
+        self.assertEqual(self.mock.calls[0].request.method, "GET")
 
-        responses.add(responses.GET, f"https://api.example.com/designs/{design_id}", json=response_data, status=200)
+    def test_choose_logo_color(self):
+        response = self.client.choose_logo_color(design_id="123", color=_CHOOSE_LOGO_COLOR_PAYLOAD["color"])
 
-        response = self.client.get_design_details(design_id)
+        data = _CHOOSE_LOGO_COLOR_RESPONSE["data"]
+        self.assertIsInstance(response, ChooseLogoColorResponse)
+        self.assertEqual(response.design_id, data["designId"])
+        self.assertEqual(response.color, data["logoColor"])
 
-        self.assertIsInstance(response, GetDesignDetailsResponse)
-        self.assertEqual(response.design_id, response_data["data"]["designId"])
-        self.assertEqual(response.designer_id, response_data["data"]["designerId"])
-        self.assertEqual(response.design_name, response_data["data"]["designName"])
-        self.assertEqual(response.design_description, response_data["data"]["designDescription"])
-        self.assertEqual(response.categories, response_data["data"]["categories"])
-        self.assertEqual(response.tags, response_data["data"]["tags"])
-        self.assertEqual(response.price, response_data["data"]["price"])
-        self.assertEqual(response.design_url, response_data["data"]["creationTimestamp"])
-        self.assertEqual(response.image_id, response_data["data"]["imageId"])
-        self.assertEqual(response.image_url, response_data["data"]["imageUrl"])
-        self.assertEqual(response.image_upload_timestamp, response_data["data"]["imageUploadTimestamp"])
-        self.assertEqual(response.image_size, response_data["data"]["imageSize"])
-        self.assertEqual(response.image_format, response_data["data"]["imageFormat"])
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/logo-color")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _CHOOSE_LOGO_COLOR_PAYLOAD)
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, f"https://api.example.com/designs/{design_id}")
-        self.assertEqual(responses.calls[0].request.method, "GET")
+    def test_select_size_and_quantity(self):
+        response = self.client.select_size_and_quantity(design_id="123", items=_SELECT_SIZE_AND_QUANTITY_PAYLOAD["items"])
 
-    @responses.activate
-    def test_choose_logo_color(self):
-        design_id = "123"
-        expected_payload = {
-            "color": {
-                "name": "Red",
-                "hex": "#FF0000",
-                "rgb": [255, 0, 0]
-            },
-            "designId": design_id
-        }
-        response_data = {
-            "status": "success",
-            "message": "Logo color set successfully",
-            "data": {
-                "designId": design_id,
-                "logoColor": {
-                    "name": "Red",
-                    "hex": "#FF0000",
-                    "rgb": [255, 0, 0]
-                }
-            }
-        }
+        data = _SELECT_SIZE_AND_QUANTITY_RESPONSE["data"]
+        self.assertIsInstance(response, SelectSizeAndQuantityResponse)
+        self.assertEqual(response.design_id, data["designId"])
+        self.assertEqual(response.items, data["items"])
 
-        responses.add(responses.POST, "https://api.example.com/logo-color", json=response_data, status=200)
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/orders/sizes-quantity")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _SELECT_SIZE_AND_QUANTITY_PAYLOAD)
 
-        response = self.client.choose_logo_color(design_id=design_id, color=expected_payload["color"])
+    def test_set_shipping_destination(self):
+        response = self.client.set_shipping_destination(design_id="123", address=_SET_SHIPPING_DESTINATION_PAYLOAD["address"])
 
-        self.assertIsInstance(response, ChooseLogoColorResponse)
-        self.assertEqual(response.design_id, response_data["data"]["designId"])
-        self.assertEqual(response.color, response_data["data"]["logoColor"])
+        data = _SET_SHIPPING_DESTINATION_RESPONSE["data"]
+        self.assertIsInstance(response, SetShippingDestinationResponse)
+        self.assertEqual(response.design_id, data["designId"])
+        self.assertEqual(response.address, data["address"])
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/logo-color")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/orders/shipping")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _SET_SHIPPING_DESTINATION_PAYLOAD)
 
-    @responses.activate
-    def test_select_size_and_quantity(self):
-        design_id = "123"
-        expected_payload = {
-            "designId": design_id,
-            "items": [
-                {"size": "S", "quantity": 50},
-                {"size": "M", "quantity": 100},
-                {"size": "L", "quantity": 50}
-            ]
-        }
-        response_data = {
-            "status": "success",
-            "message": "Sizes and quantities set successfully",
-            "data": {
-                "designId": design_id,
-                "items": [
-                    {"size": "S", "quantity": 50},
-                    {"size": "M", "quantity": 100},
-                    {"size": "L", "quantity": 50}
-                ]
-            }
-        }
+    def test_manage_payment_methods(self):
+        response = self.client.manage_payment_methods(payment_method=_MANAGE_PAYMENT_METHODS_PAYLOAD["paymentMethod"])
 
-        responses.add(responses.POST, "https://api.example.com/orders/sizes-quantity", json=response_data, status=200)
+        self.assertIsInstance(response, ManagePaymentMethodsResponse)
+        self.assertEqual(response.payment_method_id, _MANAGE_PAYMENT_METHODS_RESPONSE["data"]["paymentMethodId"])
 
-        response = self.client.select_size_and_quantity(design_id=design_id, items=expected_payload["items"])
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/payment-methods")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _MANAGE_PAYMENT_METHODS_PAYLOAD)
 
-        self.assertIsInstance(response, SelectSizeAndQuantityResponse)
-        self.assertEqual(response.design_id, response_data["data"]["designId"])
-        self.assertEqual(response.items, response_data["data"]["items"])
+    def test_place_order(self):
+        response = self.client.place_order(design_id="123", payment_method_id="payment123")
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/orders/sizes-quantity")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
+        self.assertIsInstance(response, PlaceOrderResponse)
+        self.assertEqual(response.order_id, _PLACE_ORDER_RESPONSE["data"]["orderId"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/orders")
+        self.assertEqual(self.mock.calls[0].request.method, "POST")
+        self.assertDictEqual(json.loads(self.mock.calls[0].request.body), _PLACE_ORDER_PAYLOAD)
+
+    def test_track_order(self):
+        response = self.client.track_order("order123")
+
+        self.assertIsInstance(response, TrackOrderResponse)
+        self.assertEqual(response.order_id, _TRACK_ORDER_RESPONSE["data"]["orderId"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/orders/order123")
+        self.assertEqual(self.mock.calls[0].request.method, "GET")
+
+    def test_cancel_order(self):
+        response = self.client.cancel_order("order123")
+
+        self.assertIsInstance(response, CancelOrderResponse)
+        self.assertEqual(response.order_id, _CANCEL_ORDER_RESPONSE["data"]["orderId"])
+
+        self.assertEqual(len(self.mock.calls), 1)
+        self.assertEqual(self.mock.calls[0].request.url, "https://api.example.com/orders/order123")
+        self.assertEqual(self.mock.calls[0].request.method, "DELETE")
+
+class SwagUpApiClientTransportTests(unittest.TestCase):
+    def setUp(self):
+        self.client = SwagUpApiClient(base_url=_BASE_URL, api_key="your_api_key")
 
     @responses.activate
-    def test_set_shipping_destination(self):
+    def test_get_design_details_revalidates_with_etag(self):
         design_id = "123"
-        expected_payload = {
-            "designId": design_id,
-            "address": {
-                "recipientName": "John Doe",
-                "street": "123 Swag Street",
-                "city": "Swag City",
-                "state": "Swag State",
-                "country": "Swag Country",
-                "zip": "12345"
-            }
-        }
-        response_data = {
-            "status": "success",
-            "message": "Shipping address set successfully",
-            "data": {
-                "designId": design_id,
-                "address": {
-                    "recipientName": "John Doe",
-                    "street": "123 Swag Street",
-                    "city": "Swag City",
-                    "state": "Swag State",
-                    "country": "Swag Country",
-                    "zip": "12345"
-                }
-            }
-        }
+        url = f"https://api.example.com/designs/{design_id}"
 
-        responses.add(responses.POST, "https://api.example.com/orders/shipping", json=response_data, status=200)
+        responses.add(responses.GET, url, json=_GET_DESIGN_DETAILS_RESPONSE, status=200, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
 
-        response = self.client.set_shipping_destination(design_id=design_id, address=expected_payload["address"])
+        first = self.client.get_design_details(design_id)
+        second = self.client.get_design_details(design_id)
 
-        self.assertIsInstance(response, SetShippingDestinationResponse)
-        self.assertEqual(response.design_id, response_data["data"]["designId"])
-        self.assertEqual(response.address, response_data["data"]["address"])
+        self.assertIsInstance(second, GetDesignDetailsResponse)
+        self.assertEqual(second, first)
+        self.assertEqual(second.design_id, design_id)
+        self.assertEqual(second.image_format, _GET_DESIGN_DETAILS_RESPONSE["data"]["imageFormat"])
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/orders/shipping")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+        self.assertEqual(responses.calls[1].request.headers["If-None-Match"], '"v1"')
 
     @responses.activate
-    def test_manage_payment_methods(self):
-        expected_payload = {
-            "paymentMethod": {
-                "type": "credit card",
-                "cardNumber": "1234567812345678",
-                "expiryDate": "07/25",
-                "cvv": "123"
-            }
-        }
-        response_data = {
-            "status": "success",
-            "message": "Payment method added successfully",
-            "data": {
-                "paymentMethodId": "payment123",
-                "type": "credit card",
-                "expiryDate": "07/25"
-            }
-        }
+    def test_etag_cache_evicts_least_recently_used(self):
+        for order_id in ("order1", "order2", "order3"):
+            responses.add(responses.GET, f"{_BASE_URL}/orders/{order_id}", json=_TRACK_ORDER_RESPONSE, status=200, headers={"ETag": f'"{order_id}"'})
 
-        responses.add(responses.POST, "https://api.example.com/payment-methods", json=response_data, status=200)
+        with mock.patch("api._ETAG_CACHE_SIZE", 2):
+            self.client.track_order("order1")
+            self.client.track_order("order2")
+            self.client.track_order("order3")
 
-        response = self.client.manage_payment_methods(payment_method=expected_payload["paymentMethod"])
+        self.assertEqual(list(self.client._etag_cache), [f"{_BASE_URL}/orders/order2", f"{_BASE_URL}/orders/order3"])
 
-        self.assertIsInstance(response, ManagePaymentMethodsResponse)
-        self.assertEqual(response.payment_method_id, response_data["data"]["paymentMethodId"])
+    @responses.activate
+    def test_accepts_numeric_ids(self):
+        responses.add(responses.GET, f"{_BASE_URL}/orders/5", json=_TRACK_ORDER_RESPONSE, status=200)
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/payment-methods")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
+        self.client.track_order(5)
+
+        self.assertEqual(responses.calls[0].request.url, f"{_BASE_URL}/orders/5")
 
     @responses.activate
-    def test_place_order(self):
-        design_id = "123"
-        payment_method_id = "payment123"
-        expected_payload = {
-            "designId": design_id,
-            "paymentMethodId": payment_method_id
-        }
-        response_data = {
-            "status": "success",
-            "message": "Order placed successfully",
-            "data": {
-                "orderId": "order123",
-                "designId": design_id,
-                "paymentMethodId": payment_method_id,
-                "status": "Processing",
-                "timestamp": "2023-07-10T16:00:00Z"
-            }
-        }
+    def test_batch_set_sizes(self):
+        def callback(request):
+            payload = json.loads(request.body)
+            return 200, {}, json.dumps({"status": "success", "data": payload})
 
-        responses.add(responses.POST, "https://api.example.com/orders", json=response_data, status=200)
+        responses.add_callback(responses.POST, "https://api.example.com/orders/sizes-quantity", callback=callback)
 
-        response = self.client.place_order(design_id=design_id, payment_method_id=payment_method_id)
+        jobs = [(str(design_id), [{"size": "M", "quantity": design_id}]) for design_id in range(5)]
+        results = self.client.batch_set_sizes(jobs)
 
-        self.assertIsInstance(response, PlaceOrderResponse)
-        self.assertEqual(response.order_id, response_data["data"]["orderId"])
-
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, "https://api.example.com/orders")
-        self.assertEqual(responses.calls[0].request.method, "POST")
-        self.assertDictEqual(responses.calls[0].request.json(), expected_payload)
+        self.assertEqual([result.design_id for result in results], [design_id for design_id, _ in jobs])
+        self.assertEqual([result.items for result in results], [items for _, items in jobs])
+        self.assertEqual(len(responses.calls), 5)
 
     @responses.activate
-    def test_track_order(self):
+    def test_retries_transient_errors_on_get(self):
         order_id = "order123"
+        url = f"https://api.example.com/orders/{order_id}"
         response_data = {
             "status": "success",
             "message": "Order fetched successfully",
-            "data": {
-                "orderId": order_id,
-                "designId": "123",
-                "status": "Shipped",
-                "timestamp": "2023-07-10T16:00:00Z",
-                "shippingAddress": {
-                    "recipientName": "John Doe",
-                    "street": "123 Swag Street",
-                    "city": "Swag City",
-                    "state": "Swag State",
-                    "country": "Swag Country",
-                    "zip": "12345"
-                },
-                "estimatedDelivery": "2023-07-17T16:00:00Z"
-            }
+            "data": {"orderId": order_id}
         }
 
-        responses.add(responses.GET, f"https://api.example.com/orders/{order_id}", json=response_data, status=200)
+        responses.add(responses.GET, url, json={"status": "error"}, status=503)
+        responses.add(responses.GET, url, json=response_data, status=200)
 
-        response = self.client.track_order(order_id)
+        self.assertEqual(self.client.track_order(order_id).order_id, order_id)
+        self.assertEqual(len(responses.calls), 2)
 
-        self.assertIsInstance(response, TrackOrderResponse)
-        self.assertEqual(response.order_id, response_data["data"]["orderId"])
+    @responses.activate
+    def test_retries_over_plain_http(self):
+        client = SwagUpApiClient(base_url="http://localhost:8000", api_key="your_api_key")
+        url = "http://localhost:8000/orders/order123"
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, f"https://api.example.com/orders/{order_id}")
-        self.assertEqual(responses.calls[0].request.method, "GET")
+        responses.add(responses.GET, url, json={"status": "error"}, status=503)
+        responses.add(responses.GET, url, json=_TRACK_ORDER_RESPONSE, status=200)
+
+        self.assertEqual(client.track_order("order123").order_id, "order123")
+        self.assertEqual(len(responses.calls), 2)
 
     @responses.activate
-    def test_cancel_order(self):
-        order_id = "order123"
-        response_data = {
-            "status": "success",
-            "message": "Order cancelled successfully",
-            "data": {
-                "orderId": order_id,
-                "status": "Cancelled"
-            }
-        }
+    def test_does_not_retry_post(self):
+        responses.add(responses.POST, "https://api.example.com/orders", json={"status": "error"}, status=503)
 
-        responses.add(responses.DELETE, f"https://api.example.com/orders/{order_id}", json=response_data, status=200)
+        with self.assertRaisesRegex(ValueError, "Request failed with status code: 503"):
+            self.client.place_order(design_id="123", payment_method_id="payment123")
+        self.assertEqual(len(responses.calls), 1)
 
-        response = self.client.cancel_order(order_id)
+    @responses.activate
+    def test_malformed_success_body_raises_value_error(self):
+        responses.add(responses.GET, f"{_BASE_URL}/designs/123", json={"status": "success", "data": {"designId": "123"}}, status=200)
+        responses.add(responses.DELETE, f"{_BASE_URL}/orders/order123", json={"status": "success"}, status=200)
 
-        self.assertIsInstance(response, CancelOrderResponse)
-        self.assertEqual(response.order_id, response_data["data"]["orderId"])
+        with self.assertRaisesRegex(ValueError, "missing field 'designerId'"):
+            self.client.get_design_details("123")
+        with self.assertRaisesRegex(ValueError, 'missing "data" object'):
+            self.client.cancel_order("order123")
 
-        self.assertEqual(len(responses.calls), 1)
-        self.assertEqual(responses.calls[0].request.url, f"https://api.example.com/orders/{order_id}")
-        self.assertEqual(responses.calls[0].request.method, "DELETE")
+    @responses.activate
+    def test_error_status_raises_value_error(self):
+        responses.add(responses.GET, "https://api.example.com/orders/missing", json={"status": "error"}, status=404)
+        responses.add(responses.DELETE, "https://api.example.com/orders/order123", json={"status": "error"}, status=409)
+
+        with self.assertRaisesRegex(ValueError, "Resource not found."):
+            self.client.track_order("missing")
+        with self.assertRaisesRegex(ValueError, "Request failed with status code: 409"):
+            self.client.cancel_order("order123")
+
+class ValidatorCacheTests(unittest.TestCase):
+    def test_repeat_lookup_returns_same_validator(self):
+        self.assertIs(get_validator(DESIGN_SCHEMA), get_validator(DESIGN_SCHEMA))
+
+    def test_evicts_least_recently_used(self):
+        schemas = [ColorSchema() for _ in range(3)]
+
+        with mock.patch("api._validator_cache", OrderedDict()), mock.patch("api._VALIDATOR_CACHE_SIZE", 2):
+            first = get_validator(schemas[0])
+            get_validator(schemas[1])
+            get_validator(schemas[0])
+            get_validator(schemas[2])
+
+            self.assertEqual(list(api._validator_cache), [id(schemas[0]), id(schemas[2])])
+            self.assertIs(api._validator_cache[id(schemas[0])][0], schemas[0])
+            self.assertIs(get_validator(schemas[0]), first)
+
+    def test_partial_schema_gets_its_own_validator(self):
+        partial = get_schema(DesignSchema, only=["price"])
+        validator = get_validator(partial)
+
+        self.assertIsNot(validator, get_validator(DESIGN_SCHEMA))
+        validator({"price": 19.99})
+        with self.assertRaises(ValueError):
+            get_validator(DESIGN_SCHEMA)({"price": 19.99})
+        with self.assertRaises(ValueError):
+            validator({"price": "free"})
+
+    def test_validator_agrees_with_schema(self):
+        validator = get_validator(DESIGN_SCHEMA)
+        valid = {
+            "designer_id": "designer123",
+            "design_name": "Cool Cat",
+            "design_description": "Cat wearing sunglasses",
+            "categories": ["Animals", "Humor"],
+            "tags": ["cat", "cool", "sunglasses"],
+            "price": 19.99,
+        }
+        cases = [
+            {},
+            {"categories": ("Animals", "Humor")},
+            {"price": 20},
+            {"categories": "Animals"},
+            {"categories": ["Animals", 42]},
+            {"tags": ("cat", 42)},
+            {"price": True},
+            {"designer_id": None},
+        ]
+        for overrides in cases:
+            payload = {**valid, **overrides}
+            with self.subTest(overrides=overrides):
+                try:
+                    validator(payload)
+                    accepted = True
+                except ValueError:
+                    accepted = False
+                self.assertEqual(accepted, not DESIGN_SCHEMA.validate(payload))
+
+        missing = {k: v for k, v in valid.items() if k != "tags"}
+        with self.assertRaises(ValueError):
+            validator(missing)
+        self.assertTrue(DESIGN_SCHEMA.validate(missing))
+
+class SwagUpAsyncApiClientTests(unittest.TestCase):
+    @responses.activate
+    def test_gather_independent_calls(self):
+        responses.add(responses.GET, f"{_BASE_URL}/designs/123", json=_GET_DESIGN_DETAILS_RESPONSE, status=200)
+        responses.add(responses.GET, f"{_BASE_URL}/orders/order123", json=_TRACK_ORDER_RESPONSE, status=200)
+
+        async def run():
+            async with SwagUpAsyncApiClient(base_url=_BASE_URL, api_key="your_api_key") as client:
+                return await asyncio.gather(client.get_design_details("123"), client.track_order("order123"))
+
+        design, order = asyncio.run(run())
+
+        self.assertIsInstance(design, GetDesignDetailsResponse)
+        self.assertEqual(design.design_id, "123")
+        self.assertIsInstance(order, TrackOrderResponse)
+        self.assertEqual(order.order_id, "order123")
+        self.assertEqual(len(responses.calls), 2)
+        for call in responses.calls:
+            self.assertEqual(call.request.headers["X-SwagUp-API-Key"], "your_api_key")
 
 if __name__ == "__main__":
     unittest.main()